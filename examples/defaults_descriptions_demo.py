@@ -12,173 +12,185 @@ New syntax:
 
 from string_schema import parse_string_schema, validate_to_dict
 import json
+import sys
 
 
-def print_section(title):
-    """Print a formatted section header"""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print('='*60)
-
-
-def demo_default_values():
-    """Demonstrate default value syntax"""
-    print_section("Default Values")
-    
-    # Define schema with defaults
-    schema_str = """
+# Schema with defaults
+_SCHEMA_DEFAULTS = """
         active:bool=true,
         count:int=0,
         status:string=pending,
         price:number=9.99
     """
+
+# Schema with descriptions
+_SCHEMA_DESCRIPTIONS = """
+        name:string | User's full name,
+        age:int | User's age in years,
+        email:email | Contact email address,
+        created:datetime | Account creation timestamp
+    """
+
+# Schema with both defaults and descriptions
+_SCHEMA_COMBINED = """
+        name:string | User's full name,
+        age:int(0,120)=18 | User's age in years,
+        active:bool=true | Whether the account is active,
+        email:string? | Optional email address,
+        count:int(1,1000)=1 | Number of items to process
+    """
+
+# Worker parameters schema
+_SCHEMA_WORKER_PARAMETERS = """
+        enable_cleanup:bool=true | Enable article cleanup step,
+        enable_cat_tag:bool=true | Enable category and tag assignment,
+        enable_create_summary:bool=true | Enable summary generation,
+        enable_embedding_generation:bool=true | Enable embedding generation,
+        max_articles_per_iteration:int(1,1000)=1 | Maximum articles to process per run,
+        processing_days_limit:int(1,365)=7 | Number of days to look back for articles,
+        model_name:string? | LLM model to use (leave empty for default)
+    """
+
+# Schema with null defaults
+_SCHEMA_NULL_DEFAULTS = """
+        name:string,
+        email:string?=null | Optional email (defaults to null),
+        phone:string?=null | Optional phone (defaults to null),
+        notes:string? | Optional notes (no default)
+    """
+
+
+def add_section(lines, title):
+    """Append a formatted section header to the output lines"""
+    lines.append(f"\n{'='*60}")
+    lines.append(f"  {title}")
+    lines.append('='*60)
+
+
+def emit_section(lines):
+    """Write a buffered section to stdout in a single write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def demo_default_values(schema_str, schema):
+    """Demonstrate default value syntax"""
+    lines = []
+    add_section(lines, "Default Values")
     
-    print("\nSchema definition:")
-    print(schema_str)
+    lines.append("\nSchema definition:")
+    lines.append(schema_str)
     
-    # Parse schema
-    schema = parse_string_schema(schema_str)
-    print("\nGenerated JSON Schema:")
-    print(json.dumps(schema, indent=2))
+    lines.append("\nGenerated JSON Schema:")
+    lines.append(json.dumps(schema, indent=2))
     
     # Validate data with defaults
-    print("\n--- Test 1: Empty data (uses all defaults) ---")
+    lines.append("\n--- Test 1: Empty data (uses all defaults) ---")
     data = {}
     result = validate_to_dict(data, schema_str)
-    print(f"Input:  {data}")
-    print(f"Output: {result}")
+    lines.append(f"Input:  {data}")
+    lines.append(f"Output: {result}")
     
-    print("\n--- Test 2: Partial data (some defaults) ---")
+    lines.append("\n--- Test 2: Partial data (some defaults) ---")
     data = {"count": 5}
     result = validate_to_dict(data, schema_str)
-    print(f"Input:  {data}")
-    print(f"Output: {result}")
+    lines.append(f"Input:  {data}")
+    lines.append(f"Output: {result}")
     
-    print("\n--- Test 3: Override defaults ---")
+    lines.append("\n--- Test 3: Override defaults ---")
     data = {"active": False, "count": 10, "status": "completed", "price": 19.99}
     result = validate_to_dict(data, schema_str)
-    print(f"Input:  {data}")
-    print(f"Output: {result}")
+    lines.append(f"Input:  {data}")
+    lines.append(f"Output: {result}")
+
+    emit_section(lines)
 
 
-def demo_descriptions():
+def demo_descriptions(schema_str, schema):
     """Demonstrate description syntax"""
-    print_section("Field Descriptions")
-    
-    # Define schema with descriptions
-    schema_str = """
-        name:string | User's full name,
-        age:int | User's age in years,
-        email:email | Contact email address,
-        created:datetime | Account creation timestamp
-    """
+    lines = []
+    add_section(lines, "Field Descriptions")
     
-    print("\nSchema definition:")
-    print(schema_str)
+    lines.append("\nSchema definition:")
+    lines.append(schema_str)
     
-    # Parse schema
-    schema = parse_string_schema(schema_str)
-    print("\nGenerated JSON Schema (with descriptions):")
-    print(json.dumps(schema, indent=2))
+    lines.append("\nGenerated JSON Schema (with descriptions):")
+    lines.append(json.dumps(schema, indent=2))
+
+    emit_section(lines)
 
 
-def demo_combined_syntax():
+def demo_combined_syntax(schema_str, schema):
     """Demonstrate combined defaults and descriptions"""
-    print_section("Combined: Defaults + Descriptions")
+    lines = []
+    add_section(lines, "Combined: Defaults + Descriptions")
     
-    # Define schema with both defaults and descriptions
-    schema_str = """
-        name:string | User's full name,
-        age:int(0,120)=18 | User's age in years,
-        active:bool=true | Whether the account is active,
-        email:string? | Optional email address,
-        count:int(1,1000)=1 | Number of items to process
-    """
-    
-    print("\nSchema definition:")
-    print(schema_str)
+    lines.append("\nSchema definition:")
+    lines.append(schema_str)
     
-    # Parse schema
-    schema = parse_string_schema(schema_str)
-    print("\nGenerated JSON Schema:")
-    print(json.dumps(schema, indent=2))
+    lines.append("\nGenerated JSON Schema:")
+    lines.append(json.dumps(schema, indent=2))
     
     # Validate data
-    print("\n--- Test: Minimal data (uses defaults) ---")
+    lines.append("\n--- Test: Minimal data (uses defaults) ---")
     data = {"name": "John Doe"}
     result = validate_to_dict(data, schema_str)
-    print(f"Input:  {data}")
-    print(f"Output: {result}")
+    lines.append(f"Input:  {data}")
+    lines.append(f"Output: {result}")
 
+    emit_section(lines)
 
-def demo_worker_parameters():
+
+def demo_worker_parameters(schema_str, schema):
     """Demonstrate using enhanced syntax for worker parameters"""
-    print_section("Real-World Example: Worker Parameters")
+    lines = []
+    add_section(lines, "Real-World Example: Worker Parameters")
     
-    # Define worker parameters schema
-    schema_str = """
-        enable_cleanup:bool=true | Enable article cleanup step,
-        enable_cat_tag:bool=true | Enable category and tag assignment,
-        enable_create_summary:bool=true | Enable summary generation,
-        enable_embedding_generation:bool=true | Enable embedding generation,
-        max_articles_per_iteration:int(1,1000)=1 | Maximum articles to process per run,
-        processing_days_limit:int(1,365)=7 | Number of days to look back for articles,
-        model_name:string? | LLM model to use (leave empty for default)
-    """
+    lines.append("\nWorker Parameters Schema:")
+    lines.append(schema_str)
     
-    print("\nWorker Parameters Schema:")
-    print(schema_str)
-    
-    # Parse schema
-    schema = parse_string_schema(schema_str)
-    print("\nGenerated JSON Schema:")
-    print(json.dumps(schema, indent=2))
+    lines.append("\nGenerated JSON Schema:")
+    lines.append(json.dumps(schema, indent=2))
     
     # Example 1: Default configuration
-    print("\n--- Example 1: Default configuration ---")
+    lines.append("\n--- Example 1: Default configuration ---")
     params = {}
     result = validate_to_dict(params, schema_str)
-    print(f"Input:  {params}")
-    print(f"Output: {json.dumps(result, indent=2)}")
+    lines.append(f"Input:  {params}")
+    lines.append(f"Output: {json.dumps(result, indent=2)}")
     
     # Example 2: Custom configuration
-    print("\n--- Example 2: Custom configuration ---")
+    lines.append("\n--- Example 2: Custom configuration ---")
     params = {
         "enable_cleanup": False,
         "max_articles_per_iteration": 10,
         "model_name": "openrouter:google/gemini-2.5-flash-lite"
     }
     result = validate_to_dict(params, schema_str)
-    print(f"Input:  {json.dumps(params, indent=2)}")
-    print(f"Output: {json.dumps(result, indent=2)}")
+    lines.append(f"Input:  {json.dumps(params, indent=2)}")
+    lines.append(f"Output: {json.dumps(result, indent=2)}")
+
+    emit_section(lines)
 
 
-def demo_null_defaults():
+def demo_null_defaults(schema_str, schema):
     """Demonstrate null default values"""
-    print_section("Null Default Values")
+    lines = []
+    add_section(lines, "Null Default Values")
     
-    # Define schema with null defaults
-    schema_str = """
-        name:string,
-        email:string?=null | Optional email (defaults to null),
-        phone:string?=null | Optional phone (defaults to null),
-        notes:string? | Optional notes (no default)
-    """
+    lines.append("\nSchema definition:")
+    lines.append(schema_str)
     
-    print("\nSchema definition:")
-    print(schema_str)
-    
-    # Parse schema
-    schema = parse_string_schema(schema_str)
-    print("\nGenerated JSON Schema:")
-    print(json.dumps(schema, indent=2))
+    lines.append("\nGenerated JSON Schema:")
+    lines.append(json.dumps(schema, indent=2))
     
     # Validate data
-    print("\n--- Test: Minimal data ---")
+    lines.append("\n--- Test: Minimal data ---")
     data = {"name": "John Doe"}
     result = validate_to_dict(data, schema_str)
-    print(f"Input:  {data}")
-    print(f"Output: {result}")
+    lines.append(f"Input:  {data}")
+    lines.append(f"Output: {result}")
+
+    emit_section(lines)
 
 
 def main():
@@ -187,11 +199,23 @@ def main():
     print("  String Schema: Defaults and Descriptions Demo")
     print("="*60)
     
-    demo_default_values()
-    demo_descriptions()
-    demo_combined_syntax()
-    demo_worker_parameters()
-    demo_null_defaults()
+    # Parse every schema once up front; each demo reuses its parsed schema
+    parsed = {
+        schema_str: parse_string_schema(schema_str)
+        for schema_str in (
+            _SCHEMA_DEFAULTS,
+            _SCHEMA_DESCRIPTIONS,
+            _SCHEMA_COMBINED,
+            _SCHEMA_WORKER_PARAMETERS,
+            _SCHEMA_NULL_DEFAULTS,
+        )
+    }
+
+    demo_default_values(_SCHEMA_DEFAULTS, parsed[_SCHEMA_DEFAULTS])
+    demo_descriptions(_SCHEMA_DESCRIPTIONS, parsed[_SCHEMA_DESCRIPTIONS])
+    demo_combined_syntax(_SCHEMA_COMBINED, parsed[_SCHEMA_COMBINED])
+    demo_worker_parameters(_SCHEMA_WORKER_PARAMETERS, parsed[_SCHEMA_WORKER_PARAMETERS])
+    demo_null_defaults(_SCHEMA_NULL_DEFAULTS, parsed[_SCHEMA_NULL_DEFAULTS])
     
     print("\n" + "="*60)
     print("  Demo Complete!")
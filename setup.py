@@ -49,6 +49,9 @@ setup(
             "sphinx-rtd-theme>=1.0.0",
             "myst-parser>=0.18.0",
         ],
+        "fast": [
+            "msgspec>=0.18.0",
+        ],
     },
     keywords="schema validation json llm ai data-extraction",
     project_urls={
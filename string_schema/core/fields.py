@@ -17,6 +17,13 @@ _NO_DEFAULT = object()
 class SimpleField:
     """Enhanced SimpleField with support for all new features"""
 
+    # Fields are created for every parsed schema field; slots avoid a per-instance __dict__
+    __slots__ = (
+        'field_type', 'description', 'required', 'default', 'has_default',
+        'min_val', 'max_val', 'min_length', 'max_length', 'choices',
+        'min_items', 'max_items', 'format_hint', 'union_types',
+    )
+
     def __init__(self, field_type: str, description: str = "", required: bool = True,
                  default: Any = _NO_DEFAULT, min_val: Optional[Union[int, float]] = None,
                  max_val: Optional[Union[int, float]] = None, min_length: Optional[int] = None,
@@ -7,9 +7,11 @@ Contains integrations with external libraries and standards.
 from .pydantic import create_pydantic_model
 from .json_schema import to_json_schema
 from .openapi import to_openapi_schema
+from .msgspec import json_schema_to_struct
 
 __all__ = [
     "create_pydantic_model",
     "to_json_schema", 
-    "to_openapi_schema"
+    "to_openapi_schema",
+    "json_schema_to_struct"
 ]
@@ -0,0 +1,155 @@
+"""
+msgspec integration for String Schema
+
+Contains functions for creating msgspec Struct types from JSON Schema, so data
+can be validated by msgspec's compiled validators.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, List, Literal, Mapping, Optional, Union
+from uuid import UUID
+import logging
+
+# Optional msgspec import
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+# Same pattern the Pydantic integration falls back to when EmailStr is unavailable
+_EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+
+def json_schema_to_struct(json_schema: Mapping[str, Any], name: str) -> type:
+    """
+    Create msgspec Struct type from JSON Schema.
+
+    Args:
+        json_schema: JSON Schema dictionary of type 'object'
+        name: Name of the Struct class
+
+    Returns:
+        Dynamically created msgspec Struct class
+
+    Example:
+        User = json_schema_to_struct(string_to_json_schema("name:string, age:int?"), 'User')
+        user = msgspec.convert({"name": "John"}, User)
+    """
+    if not HAS_MSGSPEC:
+        raise ImportError("msgspec is required for json_schema_to_struct. Install with: pip install msgspec")
+
+    if json_schema.get('type') != 'object':
+        raise ValueError("JSON Schema must be of type 'object' to create msgspec Struct")
+
+    required_fields = set(json_schema.get('required', ()))
+
+    struct_fields = []
+    for field_name, field_schema in json_schema.get('properties', {}).items():
+        struct_fields.append(_json_schema_to_struct_field(
+            field_name, field_schema, field_name in required_fields, f"{name}{field_name.title()}"
+        ))
+
+    # kw_only lets fields with defaults precede required ones, keeping schema order
+    return msgspec.defstruct(name, struct_fields, kw_only=True)
+
+
+def json_schema_to_type(json_schema: Mapping[str, Any], name: str) -> Any:
+    """
+    Create the msgspec type for a top-level JSON Schema.
+
+    Args:
+        json_schema: JSON Schema dictionary of type 'object' or 'array'
+        name: Name of the (item) Struct class
+
+    Returns:
+        Struct class for object schemas, list type for array schemas
+    """
+    if not HAS_MSGSPEC:
+        raise ImportError("msgspec is required for json_schema_to_type. Install with: pip install msgspec")
+
+    if json_schema.get('type') == 'array':
+        return _json_schema_to_type(json_schema, name)
+    return json_schema_to_struct(json_schema, name)
+
+
+def _json_schema_to_struct_field(field_name: str, field_schema: Mapping[str, Any],
+                                 required: bool, parent_name: str) -> tuple:
+    """Convert JSON Schema field to msgspec.defstruct field specification"""
+    field_type = _json_schema_to_type(field_schema, parent_name)
+
+    # Handle optional fields
+    if not required:
+        field_type = Optional[field_type]
+
+    if 'default' in field_schema:
+        return (field_name, field_type, field_schema['default'])
+    elif not required:
+        return (field_name, field_type, None)
+    return (field_name, field_type)
+
+
+def _json_schema_to_type(field_schema: Mapping[str, Any], parent_name: str) -> Any:
+    """Convert JSON Schema property to a msgspec-compatible type annotation"""
+    # Type mapping; like the Pydantic integration, 'null' in a union falls
+    # back to str, so both validators reject None for "string|null"
+    type_mapping = {
+        'string': str,
+        'integer': int,
+        'number': float,
+        'boolean': bool,
+    }
+    meta = {}
+
+    # Handle union types
+    if 'anyOf' in field_schema:
+        python_type = Union[tuple(type_mapping.get(option.get('type', 'string'), str)
+                                  for option in field_schema['anyOf'])]
+    elif field_schema.get('type') == 'object':
+        # Handle nested objects by creating a nested Struct
+        python_type = json_schema_to_struct(field_schema, f"{parent_name}Nested")
+    elif field_schema.get('type') == 'array':
+        items_schema = field_schema.get('items', {})
+        if items_schema.get('type') == 'object':
+            python_type = List[json_schema_to_struct(items_schema, f"{parent_name}Item")]
+        else:
+            python_type = List[_json_schema_to_type(items_schema, parent_name)]
+        if 'minItems' in field_schema:
+            meta['min_length'] = field_schema['minItems']
+        if 'maxItems' in field_schema:
+            meta['max_length'] = field_schema['maxItems']
+    else:
+        python_type = type_mapping.get(field_schema.get('type', 'string'), str)
+
+    # Numeric constraints
+    if 'minimum' in field_schema:
+        meta['ge'] = field_schema['minimum']
+    if 'maximum' in field_schema:
+        meta['le'] = field_schema['maximum']
+
+    # String constraints
+    if 'minLength' in field_schema:
+        meta['min_length'] = field_schema['minLength']
+    if 'maxLength' in field_schema:
+        meta['max_length'] = field_schema['maxLength']
+
+    # Format constraints (email, datetime, etc.); msgspec has no URL type
+    format_type = field_schema.get('format')
+    if format_type == 'email':
+        meta['pattern'] = _EMAIL_PATTERN
+    elif format_type == 'date-time':
+        python_type = datetime
+    elif format_type == 'uuid':
+        python_type = UUID
+
+    # Enum constraints
+    if 'enum' in field_schema:
+        python_type = Literal[tuple(field_schema['enum'])]
+
+    if meta:
+        python_type = Annotated[python_type, msgspec.Meta(**meta)]
+
+    return python_type
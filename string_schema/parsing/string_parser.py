@@ -4,8 +4,12 @@ String-based schema parsing for String Schema
 Contains functionality for parsing human-readable schema strings into JSON Schema.
 """
 
+import copy
 import re
-from typing import Dict, Any, List, Union, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple, Union, Optional
 import logging
 
 from ..core.fields import SimpleField, _NO_DEFAULT
@@ -13,12 +17,75 @@ from ..core.builders import simple_schema, list_of_objects_schema
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every parse, compiled once at import time
+_ARRAY_WITH_CONSTRAINTS_RE = re.compile(r'^\[([^\]]+)\]\(([^)]+)\)$')
+_ENUM_DEF_RE = re.compile(r'^(?:enum|choice|select)\(([^)]+)\)$')
+_ARRAY_TYPE_DEF_RE = re.compile(r'^(?:array|list)\(([^)]+)\)$')
+_TYPE_WITH_CONSTRAINTS_RE = re.compile(r'^(\w+)\(([^)]+)\)$')
+# Brackets, or a quoted default whose brackets are literal text ('=":("');
+# the quotes never span a field or description separator
+_BRACKET_RE = re.compile(r'''=\s*(?:"[^",|]*"|'[^',|]*')|[\[\]{}()]''')
+_TRIPLE_QUOTES_RE = re.compile(r'^[\'\"]{3}|[\'\"]{3}$')
+_CONSTRAINT_FEATURE_RES = (
+    re.compile(r'string\([^)]+\)'),  # string(min=1,max=100)
+    re.compile(r'int\([^)]+\)'),     # int(0,120)
+    re.compile(r'number\([^)]+\)'),  # number(min=0)
+    re.compile(r'text\([^)]+\)'),    # text(max=500)
+    re.compile(r'\]\([^)]+\)'),      # [string](max=5)
+)
+
+_DEPTH_BYTES = tuple(bytes((depth,)) for depth in range(256))
+
+# JSON Schema "format" values for special types (phone has no standard format)
+_JSON_SCHEMA_FORMATS = {
+    'email': 'email',
+    'url': 'uri',
+    'uri': 'uri',
+    'datetime': 'date-time',
+    'date': 'date',
+    'uuid': 'uuid',
+}
+
+# Keyword defaults recognised by _parse_default_value (matched case-insensitively)
+_BOOL_DEFAULTS = {'true': True, 'false': False}
+_NULL_DEFAULTS = frozenset({'null', 'none'})
+
 
 def parse_string_schema(schema_str: str, is_list: bool = False) -> Dict[str, Any]:
     """Parse enhanced string schema with support for arrays, enums, unions, and special types"""
-    schema_str = schema_str.strip()
+    # Callers own the returned dict, so hand out a copy of the cached schema
+    schema, _ = _parse_string_schema_cached(schema_str.strip())
+    return copy.deepcopy(schema)
+
+
+def _get_cached_schema(schema_str: str) -> Mapping[str, Any]:
+    """
+    Return a read-only view of the cached JSON Schema for a schema string.
+
+    Dicts are exposed as MappingProxyType and lists as tuples, so the view can
+    be shared between callers and threads without copying and without any
+    risk of corrupting the cache. Internal callers that only inspect the
+    schema use this to skip the defensive copy made by parse_string_schema().
+    """
+    _, view = _parse_string_schema_cached(schema_str.strip())
+    return view
+
+
+@lru_cache(maxsize=512)
+def _parse_string_schema_cached(schema_str: str) -> Tuple[Dict[str, Any], Mapping[str, Any]]:
+    """Parse a stripped schema string into (schema, read-only view); memoized per string"""
     parsed_structure = _parse_schema_structure(schema_str)
-    return _structure_to_json_schema(parsed_structure)
+    schema = _structure_to_json_schema(parsed_structure)
+    return schema, _read_only_view(schema)
+
+
+def _read_only_view(value: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only_view(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only_view(item) for item in value)
+    return value
 
 
 def _parse_schema_structure(schema_str: str) -> Dict[str, Any]:
@@ -40,7 +107,7 @@ def _parse_schema_structure(schema_str: str) -> Dict[str, Any]:
         array_constraints = {}
 
         # Extract constraints if present: [type](constraints)
-        constraint_match = re.match(r'^\[([^\]]+)\]\(([^)]+)\)$', schema_str)
+        constraint_match = _ARRAY_WITH_CONSTRAINTS_RE.match(schema_str)
         if constraint_match:
             inner_content = constraint_match.group(1).strip()
             constraint_str = constraint_match.group(2).strip()
@@ -102,11 +169,10 @@ def _parse_schema_structure(schema_str: str) -> Dict[str, Any]:
 def _parse_array_constraints(constraint_str: str) -> Dict[str, Any]:
     """Parse array constraints like 'min=1,max=5'"""
     constraints = {}
-    parts = [part.strip() for part in constraint_str.split(',')]
-    
-    for part in parts:
-        if '=' in part:
-            key, value = part.split('=', 1)
+    for part in constraint_str.split(','):
+        part = part.strip()
+        key, sep, value = part.partition('=')
+        if sep:
             key = key.strip()
             value = value.strip()
             
@@ -124,21 +190,29 @@ def _parse_array_constraints(constraint_str: str) -> Dict[str, Any]:
 def _parse_object_fields(fields_str: str) -> Dict[str, Any]:
     """Parse object fields with enhanced syntax"""
     fields_str = _normalize_string_schema(fields_str)
-    field_parts = _split_field_definitions_with_nesting(fields_str)
+    if ',' in fields_str:
+        field_parts = _split_field_definitions_with_nesting(fields_str)
+    else:
+        # Single field (normalization joins lines with commas): nothing to split
+        field_parts = [(fields_str.strip(), None)]
     
     fields = {}
-    for field_part in field_parts:
-        field_name, field_def = _parse_single_field_with_nesting(field_part.strip())
+    for field_part, depths in field_parts:
+        field_name, field_def = _parse_single_field_with_nesting(field_part, depths)
         if field_name:
-            fields[field_name] = field_def
+            # Interned so property keys are shared across cached schemas and validated data
+            fields[sys.intern(field_name)] = field_def
     
     return fields
 
 
-def _parse_single_field_with_nesting(field_str: str) -> tuple:
+def _parse_single_field_with_nesting(field_str: str, depths: Optional[bytes] = None) -> tuple:
     """
     Parse a single field with enhanced syntax support.
 
+    depths is the field's slice of the enclosing object's _depth_map(), if
+    already computed; it is kept in step with field_str as the field is cut up.
+
     New syntax support:
         - Descriptions: field:type | description
         - Defaults: field:type=default
@@ -159,122 +233,45 @@ def _parse_single_field_with_nesting(field_str: str) -> tuple:
     # Only split on | if it's not part of a union type definition
     # Union types are like "string|int|null" (no spaces, part of type definition)
     # Descriptions are like "type | description" (with space before |)
-    # Look for " |" pattern to distinguish from union types
-    if ' |' in field_str:
+    # Look for " |" pattern to distinguish from union types, skipping any
+    # inside nested definitions like "items:[{name:string | Item name}]"
+    separator_pos = _find_top_level(field_str, ' |', depths)
+    if separator_pos >= 0:
         # This is a description separator, not a union type
-        parts = field_str.split(' |', 1)
-        field_str = parts[0].strip()
-        if len(parts) > 1:
-            description = parts[1].strip()
+        description = field_str[separator_pos + 2:].strip()
+        field_str = field_str[:separator_pos].strip()
+        if depths is not None:
+            depths = depths[:len(field_str) + 1]
 
     # Step 2: Check for optional marker (?)
     # Must be done BEFORE extracting default to handle "string?=null" correctly
     required = True
     if '?' in field_str:
-        # Check if ? is before = (e.g., "string?=null")
-        if '=' in field_str:
-            # Find position of ? and =
+        # Check if ? is before = (e.g., "string?=null"); an = inside a nested
+        # definition like "items:[{qty:int=1}]?" is not this field's default
+        eq_pos = _find_top_level(field_str, '=', depths)
+        if eq_pos >= 0:
             q_pos = field_str.find('?')
-            eq_pos = field_str.find('=')
             if q_pos < eq_pos:
                 # ? comes before =, so it's an optional marker
                 field_str = field_str[:q_pos] + field_str[q_pos+1:]
+                if depths is not None:
+                    depths = depths[:q_pos] + depths[q_pos+1:]
                 required = False
         elif field_str.endswith('?'):
             # Simple optional marker at the end
             required = False
             field_str = field_str[:-1].strip()
+            if depths is not None:
+                depths = depths[:len(field_str) + 1]
 
-    # Step 3: Extract default value (after =)
-    # Must be done BEFORE parsing type definition to avoid conflicts with constraints
     default_value = _NO_DEFAULT  # Use sentinel to distinguish "no default" from "default is None"
-    if '=' in field_str:
-        # Check if = is after the type definition (not in constraints)
-        if ':' in field_str:
-            name_part, type_part = field_str.split(':', 1)
-            # Split type_part on = outside parentheses
-            parts = _split_on_equals_outside_parens(type_part)
-            if len(parts) == 2:
-                field_str = name_part + ':' + parts[0].strip()
-                default_str = parts[1].strip()
-                default_value = _parse_default_value(default_str)
-
-    # Step 4: Split field name and definition
-    if ':' in field_str:
-        field_name, field_def = field_str.split(':', 1)
-        field_name = field_name.strip()
-        field_def = field_def.strip()
-
-        # Handle nested structures
-        if field_def.startswith('[') or field_def.startswith('{'):
-            nested_structure = _parse_schema_structure(field_def)
-            nested_structure['required'] = required
-            return field_name, nested_structure
-
-        # Handle union types: string|int|null
-        # Union types have | without spaces around them
-        elif '|' in field_def:
-            union_types = [t.strip() for t in field_def.split('|')]
-            field_type = _normalize_type_name(union_types[0])  # Use first type as primary
-
-            # Create field with union support
-            field_obj = SimpleField(
-                field_type=field_type,
-                description=description,
-                default=default_value,
-                required=required
-            )
-            # Store union info for JSON schema generation
-            field_obj.union_types = [_normalize_type_name(t) for t in union_types]
-            return field_name, field_obj
-
-        # Handle enum types: enum(value1,value2,value3) or choice(...)
-        elif field_def.startswith(('enum(', 'choice(', 'select(')):
-            enum_values = _parse_enum_values(field_def)
-            field_obj = SimpleField(
-                field_type="string",  # Enums are string-based
-                description=description,
-                default=default_value,
-                required=required,
-                choices=enum_values
-            )
-            return field_name, field_obj
-
-        # Handle array types: array(string,max=5) or list(int,min=1)
-        elif field_def.startswith(('array(', 'list(')):
-            array_type, constraints = _parse_array_type_definition(field_def)
-            # Return as nested array structure
-            return field_name, {
-                "type": "array",
-                "items": {
-                    "type": "simple",
-                    "simple_type": array_type
-                },
-                "constraints": constraints,
-                "required": required
-            }
 
-        # Handle regular type with constraints
-        else:
-            original_type = field_def.split('(')[0].strip()  # Get type before any constraints
-            field_type, constraints = _parse_type_definition(field_def)
-
-            # Add format hint for special types
-            if original_type in ['email', 'url', 'uri', 'datetime', 'date', 'uuid', 'phone']:
-                constraints['format_hint'] = original_type
-                field_type = 'string'  # All special types are strings with format hints
-
-            field_obj = SimpleField(
-                field_type=field_type,
-                description=description,
-                default=default_value,
-                required=required,
-                **constraints
-            )
-            return field_name, field_obj
-
-    # Field name only (default to string)
-    else:
+    # Step 3: Split field name and definition once; later steps work on the
+    # definition substring only instead of re-scanning the whole field
+    colon_pos = field_str.find(':')
+    if colon_pos < 0:
+        # Field name only (default to string)
         field_name = field_str.strip()
         field_obj = SimpleField(
             field_type="string",
@@ -284,41 +281,210 @@ def _parse_single_field_with_nesting(field_str: str) -> tuple:
         )
         return field_name, field_obj
 
+    field_name = field_str[:colon_pos].strip()
+    field_def = field_str[colon_pos + 1:]
+    # The slice is only a valid map for field_def if the colon is at the top
+    # level and not inside a quoted default
+    if depths is not None and not depths[colon_pos] and field_str.find('=', 0, colon_pos) < 0:
+        depths = depths[colon_pos + 1:]
+    else:
+        depths = None
+
+    # Step 4: Extract default value (after = outside brackets)
+    # Must be done BEFORE parsing type definition to avoid conflicts with constraints
+    if '=' in field_def:
+        parts = _split_on_equals_outside_parens(field_def, depths)
+        if len(parts) == 2:
+            field_def = parts[0]
+            default_value = _parse_default_value(parts[1])
+
+    field_def = field_def.strip()
+
+    # Handle nested structures
+    if field_def.startswith('[') or field_def.startswith('{'):
+        nested_structure = _parse_schema_structure(field_def)
+        nested_structure['required'] = required
+        return field_name, nested_structure
+
+    # Handle union types: string|int|null
+    # Union types have | without spaces around them
+    elif '|' in field_def:
+        # Normalize in one pass; the list is stored for JSON schema generation
+        union_types = [_normalize_type_name(t.strip()) for t in field_def.split('|')]
+
+        # Create field with union support (first type is the primary type)
+        field_obj = SimpleField(
+            field_type=union_types[0],
+            description=description,
+            default=default_value,
+            required=required,
+            union_types=union_types
+        )
+        return field_name, field_obj
+
+    # Handle enum types: enum(value1,value2,value3) or choice(...)
+    elif field_def.startswith(('enum(', 'choice(', 'select(')):
+        enum_values = _parse_enum_values(field_def)
+        field_obj = SimpleField(
+            field_type="string",  # Enums are string-based
+            description=description,
+            default=default_value,
+            required=required,
+            choices=enum_values
+        )
+        return field_name, field_obj
+
+    # Handle array types: array(string,max=5) or list(int,min=1)
+    elif field_def.startswith(('array(', 'list(')):
+        array_type, constraints = _parse_array_type_definition(field_def)
+        # Return as nested array structure
+        return field_name, {
+            "type": "array",
+            "items": {
+                "type": "simple",
+                "simple_type": array_type
+            },
+            "constraints": constraints,
+            "required": required
+        }
+
+    # Handle regular type with constraints
+    else:
+        original_type = field_def.partition('(')[0].strip()  # Get type before any constraints
+        field_type, constraints = _parse_type_definition(field_def)
+
+        # Add format hint for special types
+        if original_type in ['email', 'url', 'uri', 'datetime', 'date', 'uuid', 'phone']:
+            constraints['format_hint'] = original_type
+            field_type = 'string'  # All special types are strings with format hints
+
+        field_obj = SimpleField(
+            field_type=field_type,
+            description=description,
+            default=default_value,
+            required=required,
+            **constraints
+        )
+        return field_name, field_obj
+
 
 def _parse_enum_values(enum_def: str) -> List[str]:
     """Parse enum values from enum(value1,value2,value3)"""
     # Extract content between parentheses
-    match = re.match(r'^(?:enum|choice|select)\(([^)]+)\)$', enum_def)
+    match = _ENUM_DEF_RE.match(enum_def)
     if not match:
         return []
 
     values_str = match.group(1)
-    values = [v.strip() for v in values_str.split(',')]
+    values = [sys.intern(v.strip()) for v in values_str.split(',')]
     return values
 
 
-def _split_on_equals_outside_parens(s: str) -> List[str]:
+@lru_cache(maxsize=512)
+def _depth_map(s: str) -> bytes:
     """
-    Split string on FIRST = outside parentheses only.
+    Return the bracket nesting depth at each index of s, one byte per character
+    plus a final byte for the end of the string.
+
+    Byte i is the number of brackets opened before index i and not yet closed,
+    so the splitters can test a candidate position in O(1) instead of
+    re-counting brackets from the start of the string. A closer with no open
+    bracket of its kind (e.g. in 'face:string=:)') is stray and leaves the
+    depth unchanged, so the depth only ever drops where an earlier opener is
+    actually closed. Brackets inside a quoted default ('sep:string="("') are
+    text and not counted. Depths are capped at 255. Because of the final byte,
+    depths[a:b + 1] is the depth map of s[a:b] whenever depths[a] is 0.
 
     Example:
-        "int(1,100)=5" -> ["int(1,100)", "5"]
-        "string=hello" -> ["string", "hello"]
-        "string=a=b" -> ["string", "a=b"]  # Only split on first =
+        _depth_map("a(b)c") -> b"\\x00\\x00\\x01\\x01\\x00\\x00"
     """
+    runs = []
+    start = 0
     depth = 0
+    paren_depth = 0
+    bracket_depth = 0
+    brace_depth = 0
 
-    for i, char in enumerate(s):
+    # Each bracket ends a run of text at the depth before it; the depth only
+    # changes at brackets, so each run is emitted as one repeated byte
+    for match in _BRACKET_RE.finditer(s):
+        char = match.group()
+        if len(char) > 1:
+            # Quoted default: stays part of the current run
+            continue
+        end = match.end()
+        runs.append(_DEPTH_BYTES[depth if depth < 255 else 255] * (end - start))
+        start = end
         if char == '(':
+            paren_depth += 1
             depth += 1
+        elif char == '[':
+            bracket_depth += 1
+            depth += 1
+        elif char == '{':
+            brace_depth += 1
+            depth += 1
+        # Closers only count when they close an open bracket of their kind
         elif char == ')':
+            if paren_depth:
+                paren_depth -= 1
+                depth -= 1
+        elif char == ']':
+            if bracket_depth:
+                bracket_depth -= 1
+                depth -= 1
+        elif brace_depth:
+            brace_depth -= 1
             depth -= 1
-        elif char == '=' and depth == 0:
-            # Found first = outside parentheses - split here
-            return [s[:i], s[i+1:]]
 
-    # No = found outside parentheses
-    return [s]
+    runs.append(_DEPTH_BYTES[depth if depth < 255 else 255] * (len(s) + 1 - start))
+    return b''.join(runs)
+
+
+def _find_top_level(s: str, sub: str, depths: Optional[bytes] = None) -> int:
+    """
+    Return the index of the first occurrence of sub outside any brackets, or -1.
+
+    Only brackets that close later in s hide an occurrence, so an unclosed
+    bracket in free text (e.g. the default in 'face:string=":(" | Frown')
+    does not swallow everything after it.
+
+    Args:
+        s: String to search
+        sub: Substring to find
+        depths: _depth_map(s), if the caller already has it
+
+    Example:
+        _find_top_level("enum(a |b) | Pick one", " |") -> 10
+    """
+    idx = s.find(sub)
+    if idx < 0:
+        return -1
+    if depths is None:
+        depths = _depth_map(s)
+    while idx >= 0 and depths[idx]:
+        # Inside a pair that closes, the depth drops below its current value later on
+        if min(depths[idx:]) >= depths[idx]:
+            return idx
+        idx = s.find(sub, idx + 1)
+    return idx
+
+
+def _split_on_equals_outside_parens(s: str, depths: Optional[bytes] = None) -> List[str]:
+    """
+    Split string on FIRST = outside parentheses and other brackets only.
+
+    Example:
+        "int(1,100)=5" -> ["int(1,100)", "5"]
+        "string=hello" -> ["string", "hello"]
+        "string=a=b" -> ["string", "a=b"]  # Only split on first =
+        "[{qty:int=1}]=[]" -> ["[{qty:int=1}]", "[]"]
+    """
+    idx = _find_top_level(s, '=', depths)
+    if idx < 0:
+        # No = found outside brackets
+        return [s]
+    return [s[:idx], s[idx+1:]]
 
 
 def _parse_default_value(default_str: str) -> Any:
@@ -332,29 +498,46 @@ def _parse_default_value(default_str: str) -> Any:
         - Strings: "hello", 'world', or unquoted
     """
     default_str = default_str.strip()
+    if not default_str:
+        return default_str
 
-    # Boolean
-    if default_str.lower() in ['true', 'false']:
-        return default_str.lower() == 'true'
+    # The first character decides which branch can possibly match, so
+    # numeric and quoted defaults never pay for a lower() copy
+    first = default_str[0]
 
-    # Null/None
-    if default_str.lower() in ['null', 'none']:
-        return None
+    # Boolean / Null
+    if first in 'tTfFnN':
+        lowered = default_str.lower()
+        if lowered in _BOOL_DEFAULTS:
+            return _BOOL_DEFAULTS[lowered]
+        if lowered in _NULL_DEFAULTS:
+            return None
 
-    # Number
-    try:
-        if '.' in default_str:
+    # String (remove quotes if present)
+    elif first in '"\'':
+        if default_str.endswith(first):
+            return default_str[1:-1]
+
+    # Number: classify with str predicates so plain values never raise
+    elif first in '+-.' or first.isdigit():
+        body = default_str[1:] if first in '+-' else default_str
+        whole, dot, fraction = body.partition('.')
+        if not dot:
+            if body.isdecimal():
+                return int(default_str)
+        elif ((whole.isdecimal() or not whole) and (fraction.isdecimal() or not fraction)
+              and (whole or fraction)):
             return float(default_str)
-        else:
-            return int(default_str)
-    except ValueError:
-        pass
 
-    # String (remove quotes if present)
-    if default_str.startswith('"') and default_str.endswith('"'):
-        return default_str[1:-1]
-    if default_str.startswith("'") and default_str.endswith("'"):
-        return default_str[1:-1]
+        # Rarer literals like 1_000 or 1.5e3 still go through int()/float()
+        if '_' in body or 'e' in body or 'E' in body:
+            try:
+                if dot:
+                    return float(default_str)
+                else:
+                    return int(default_str)
+            except ValueError:
+                pass
 
     # Return as-is (string)
     return default_str
@@ -363,7 +546,7 @@ def _parse_default_value(default_str: str) -> Any:
 def _parse_array_type_definition(array_def: str) -> tuple:
     """Parse array(type,constraints) or list(type,constraints)"""
     # Extract content between parentheses
-    match = re.match(r'^(?:array|list)\(([^)]+)\)$', array_def)
+    match = _ARRAY_TYPE_DEF_RE.match(array_def)
     if not match:
         return "string", {}
     
@@ -376,8 +559,8 @@ def _parse_array_type_definition(array_def: str) -> tuple:
     # Remaining parts are constraints
     constraints = {}
     for part in parts[1:]:
-        if '=' in part:
-            key, value = part.split('=', 1)
+        key, sep, value = part.partition('=')
+        if sep:
             key = key.strip()
             value = value.strip()
             
@@ -451,17 +634,8 @@ def _array_structure_to_schema(structure: Dict[str, Any]) -> Dict[str, Any]:
         items_schema = {"type": simple_type}
 
         # Add format for special types
-        if simple_type == "string" and original_type in ['email', 'url', 'uri', 'datetime', 'date', 'uuid']:
-            if original_type == "email":
-                items_schema["format"] = "email"
-            elif original_type in ["url", "uri"]:
-                items_schema["format"] = "uri"
-            elif original_type == "datetime":
-                items_schema["format"] = "date-time"
-            elif original_type == "date":
-                items_schema["format"] = "date"
-            elif original_type == "uuid":
-                items_schema["format"] = "uuid"
+        if simple_type == "string" and original_type in _JSON_SCHEMA_FORMATS:
+            items_schema["format"] = _JSON_SCHEMA_FORMATS[original_type]
 
     else:
         # Complex array: [{field1, field2}]
@@ -483,42 +657,26 @@ def _array_structure_to_schema(structure: Dict[str, Any]) -> Dict[str, Any]:
 
 def _simple_field_to_json_schema(field: SimpleField) -> Dict[str, Any]:
     """Convert SimpleField to JSON Schema property with enhanced features"""
-    prop = {"type": field.field_type}
-
-    # Basic metadata
-    if field.description:
-        prop["description"] = field.description
-    if field.has_default:
-        prop["default"] = field.default
-
-    # Handle union types
-    if hasattr(field, 'union_types') and field.union_types and len(field.union_types) > 1:
-        # Create anyOf for union types
-        union_schemas = []
-        for union_type in field.union_types:
-            if union_type == "null":
-                union_schemas.append({"type": "null"})
-            else:
-                union_schemas.append({"type": union_type})
-        prop = {"anyOf": union_schemas}
+    # Handle union types: anyOf replaces the base type and metadata entirely,
+    # so don't build the plain property only to throw it away
+    if field.union_types and len(field.union_types) > 1:
+        prop = {"anyOf": [{"type": union_type} for union_type in field.union_types]}
+    else:
+        prop = {"type": field.field_type}
+
+        # Basic metadata
+        if field.description:
+            prop["description"] = field.description
+        if field.has_default:
+            prop["default"] = field.default
 
     # Handle enum/choices
     if field.choices:
         prop["enum"] = field.choices
 
     # Add format hints for special types
-    if hasattr(field, 'format_hint') and field.format_hint:
-        if field.format_hint == "email":
-            prop["format"] = "email"
-        elif field.format_hint in ["url", "uri"]:
-            prop["format"] = "uri"
-        elif field.format_hint == "datetime":
-            prop["format"] = "date-time"
-        elif field.format_hint == "date":
-            prop["format"] = "date"
-        elif field.format_hint == "uuid":
-            prop["format"] = "uuid"
-        # Note: phone doesn't have a standard JSON Schema format
+    if field.format_hint in _JSON_SCHEMA_FORMATS:
+        prop["format"] = _JSON_SCHEMA_FORMATS[field.format_hint]
 
     # Numeric constraints
     if field.field_type in ["integer", "number"]:
@@ -537,45 +695,39 @@ def _simple_field_to_json_schema(field: SimpleField) -> Dict[str, Any]:
     return prop
 
 
-def _split_field_definitions_with_nesting(schema_str: str) -> List[str]:
-    """Split field definitions while respecting nesting"""
+def _split_field_definitions_with_nesting(schema_str: str) -> List[Tuple[str, bytes]]:
+    """
+    Split field definitions while respecting nesting.
+
+    Returns (field, depths) pairs, where depths is the field's slice of the
+    depth map; each field starts at the top level, so the slice is a valid
+    _depth_map() of the field itself and need not be recomputed.
+    """
     parts = []
-    current_part = ""
-    bracket_depth = 0
-    brace_depth = 0
-    paren_depth = 0
+    start = 0
+    depths = _depth_map(schema_str)
 
-    for char in schema_str:
-        if char == '[':
-            bracket_depth += 1
-        elif char == ']':
-            bracket_depth -= 1
-        elif char == '{':
-            brace_depth += 1
-        elif char == '}':
-            brace_depth -= 1
-        elif char == '(':
-            paren_depth += 1
-        elif char == ')':
-            paren_depth -= 1
-        elif char == ',' and bracket_depth == 0 and brace_depth == 0 and paren_depth == 0:
-            if current_part.strip():
-                parts.append(current_part.strip())
-            current_part = ""
+    idx = schema_str.find(',')
+    while True:
+        if idx >= 0 and depths[idx]:
+            idx = schema_str.find(',', idx + 1)
             continue
-
-        current_part += char
-
-    if current_part.strip():
-        parts.append(current_part.strip())
-
-    return parts
+        end = idx if idx >= 0 else len(schema_str)
+        part = schema_str[start:end]
+        stripped = part.strip()
+        if stripped:
+            part_start = start + len(part) - len(part.lstrip())
+            parts.append((stripped, depths[part_start:part_start + len(stripped) + 1]))
+        if idx < 0:
+            return parts
+        start = idx + 1
+        idx = schema_str.find(',', start)
 
 
 def _normalize_string_schema(schema_str: str) -> str:
     """Normalize string schema by removing comments and extra whitespace"""
     # Remove triple quotes
-    schema_str = re.sub(r'^[\'\"]{3}|[\'\"]{3}$', '', schema_str.strip())
+    schema_str = _TRIPLE_QUOTES_RE.sub('', schema_str.strip())
 
     # Process line by line
     lines = schema_str.split('\n')
@@ -588,9 +740,9 @@ def _normalize_string_schema(schema_str: str) -> str:
 
         # Remove inline comments
         if ' #' in line:
-            line = line.split(' #')[0].strip()
+            line = line.partition(' #')[0].strip()
         elif '#' in line and not line.startswith('#'):
-            line = line.split('#')[0].strip()
+            line = line.partition('#')[0].strip()
 
         normalized_parts.append(line)
 
@@ -604,7 +756,7 @@ def _parse_type_definition(type_def: str) -> tuple:
     constraints = {}
 
     # Handle constraints in parentheses: type(min=1,max=10)
-    constraint_match = re.match(r'^(\w+)\(([^)]+)\)$', type_def)
+    constraint_match = _TYPE_WITH_CONSTRAINTS_RE.match(type_def)
     if constraint_match:
         base_type = constraint_match.group(1)
         constraint_str = constraint_match.group(2)
@@ -629,8 +781,8 @@ def _parse_type_definition(type_def: str) -> tuple:
         else:
             # Handle named constraints like string(min=1,max=100)
             for part in constraint_parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
+                key, sep, value = part.partition('=')
+                if sep:
                     key = key.strip()
                     value = value.strip()
 
@@ -760,14 +912,7 @@ def validate_string_schema(schema_str: str) -> Dict[str, Any]:
         if any(t in schema_str for t in ['email', 'url', 'datetime', 'date', 'uuid', 'phone']):
             features.add('special_types')
         # Check for constraints more carefully
-        constraint_patterns = [
-            r'string\([^)]+\)',  # string(min=1,max=100)
-            r'int\([^)]+\)',     # int(0,120)
-            r'number\([^)]+\)',  # number(min=0)
-            r'text\([^)]+\)',    # text(max=500)
-            r'\]\([^)]+\)'       # [string](max=5)
-        ]
-        if any(re.search(pattern, schema_str) for pattern in constraint_patterns):
+        if any(pattern.search(schema_str) for pattern in _CONSTRAINT_FEATURE_RES):
             features.add('constraints')
 
         result['features_used'] = list(features)
@@ -15,7 +15,6 @@ Key Functions:
 
 import functools
 import uuid
-from datetime import datetime, timezone
 from typing import Any, Dict, Type, Union, Callable, Optional, List
 import logging
 
@@ -31,48 +30,6 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def _ensure_timezone_aware_dict(data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Ensure all datetime values in a dictionary have timezone information.
-
-    This function recursively processes dictionaries and lists to add UTC timezone
-    information to naive datetime objects, ensuring consistent API responses.
-
-    Args:
-        data: Dictionary that may contain datetime values
-
-    Returns:
-        Dictionary with timezone-aware datetime values converted to ISO format
-    """
-    if not isinstance(data, dict):
-        return data
-
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, datetime):
-            # Add UTC timezone to naive datetime objects
-            if value.tzinfo is None:
-                value = value.replace(tzinfo=timezone.utc)
-            # Convert to ISO format string for consistent API responses
-            result[key] = value.isoformat()
-        elif isinstance(value, dict):
-            # Recursively process nested dictionaries
-            result[key] = _ensure_timezone_aware_dict(value)
-        elif isinstance(value, list):
-            # Process lists that may contain dictionaries or datetime objects
-            result[key] = [
-                _ensure_timezone_aware_dict(item) if isinstance(item, dict)
-                else item.isoformat() if isinstance(item, datetime) and item.tzinfo is None
-                else item.replace(tzinfo=timezone.utc).isoformat() if isinstance(item, datetime)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
-
-    return result
-
-
 def string_to_model(schema_str: str, name: Optional[str] = None) -> Type[BaseModel]:
     """
     Create Pydantic model from string schema.
@@ -103,7 +60,7 @@ def string_to_model(schema_str: str, name: Optional[str] = None) -> Type[BaseMod
         raise ImportError("Pydantic is required for string_to_model. Install with: pip install pydantic")
 
     # Import here to avoid circular imports
-    from .parsing.string_parser import parse_string_schema
+    from .parsing.string_parser import _get_cached_schema
     from pydantic import create_model as pydantic_create_model, Field
     from typing import List
 
@@ -121,8 +78,8 @@ def string_to_model(schema_str: str, name: Optional[str] = None) -> Type[BaseMod
                 error_msg += f": {', '.join(validation_result['errors'])}"
             raise ValueError(error_msg)
 
-        # Convert string to JSON Schema
-        json_schema = parse_string_schema(schema_str)
+        # Convert string to JSON Schema (shared cached copy, read-only here)
+        json_schema = _get_cached_schema(schema_str)
 
         # Handle array schemas specially
         if json_schema.get('type') == 'array':
@@ -248,53 +205,12 @@ def validate_to_dict(data: Union[Dict[str, Any], Any], schema_str: str) -> Union
         raise ImportError("Pydantic is required for validate_to_dict. Install with: pip install pydantic")
 
     try:
-        # Create temporary model for validation
-        TempModel = string_to_model(schema_str, "TempValidationModel")
+        # Import here to avoid circular imports
+        from .validation.compiler import compile_validator
 
-        # Check if this is an array schema
-        from .parsing.string_parser import parse_string_schema
-        json_schema = parse_string_schema(schema_str)
-        is_array_schema = json_schema.get('type') == 'array'
-
-        if is_array_schema:
-            # For array schemas, validate the data directly
-            try:
-                # Try Pydantic v2 RootModel style
-                validated_instance = TempModel(data)
-                # Return the validated array data with timezone-aware conversion
-                result_data = validated_instance.model_dump() if hasattr(validated_instance, 'model_dump') else validated_instance.dict()
-                # Process array items for timezone-aware datetime conversion
-                if isinstance(result_data, list):
-                    return [_ensure_timezone_aware_dict(item) if isinstance(item, dict) else item for item in result_data]
-                return result_data
-            except:
-                # Fallback to Pydantic v1 style
-                validated_instance = TempModel(__root__=data)
-                # Return the validated array data with timezone-aware conversion
-                result_data = validated_instance.model_dump()['__root__'] if hasattr(validated_instance, 'model_dump') else validated_instance.dict()['__root__']
-                # Process array items for timezone-aware datetime conversion
-                if isinstance(result_data, list):
-                    return [_ensure_timezone_aware_dict(item) if isinstance(item, dict) else item for item in result_data]
-                return result_data
-        else:
-            # Handle different input types for object schemas
-            if isinstance(data, dict):
-                validated_instance = TempModel(**data)
-            elif hasattr(data, '__dict__'):
-                # Handle objects with attributes
-                validated_instance = TempModel(**data.__dict__)
-            else:
-                # Try direct validation
-                validated_instance = TempModel(data)
-
-            # Return as dictionary with timezone-aware datetime handling
-            if hasattr(validated_instance, 'model_dump'):
-                result_dict = validated_instance.model_dump()
-            else:
-                result_dict = validated_instance.dict()
-
-            # Ensure timezone-aware datetime conversion for consistent API responses
-            return _ensure_timezone_aware_dict(result_dict)
+        # Parsing and model generation happen once per schema string
+        validator = compile_validator(schema_str)
+        return validator(data)
 
     except ValidationError as e:
         # Re-raise the original validation error
@@ -335,12 +251,15 @@ def validate_to_model(data: Union[Dict[str, Any], Any], schema_str: str):
         raise ImportError("Pydantic is required for validate_to_model. Install with: pip install pydantic")
 
     try:
-        # Create temporary model for validation
-        TempModel = string_to_model(schema_str, "TempValidationModel")
+        # Import here to avoid circular imports
+        from .validation.compiler import compile_model
+
+        # Reuse the validation model generated for this schema string
+        TempModel = compile_model(schema_str)
 
         # Check if this is an array schema
-        from .parsing.string_parser import parse_string_schema
-        json_schema = parse_string_schema(schema_str)
+        from .parsing.string_parser import _get_cached_schema
+        json_schema = _get_cached_schema(schema_str)
         is_array_schema = json_schema.get('type') == 'array'
 
         if is_array_schema:
@@ -0,0 +1,13 @@
+"""
+Validation module for String Schema
+
+Contains functionality for compiling string schemas into reusable validators.
+"""
+
+from .compiler import compile_model, compile_validator, compile_native_validator
+
+__all__ = [
+    "compile_model",
+    "compile_validator",
+    "compile_native_validator"
+]
@@ -0,0 +1,119 @@
+"""
+Runtime code generation for String Schema validators
+
+Generates Python source specialized to one JSON Schema and compiles it into
+a function. The generated converters turn datetime values into timezone-aware
+ISO strings by visiting only the paths that can hold them, so schemas without
+datetime fields need no conversion at all.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Mapping, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _iso_utc(value: datetime) -> str:
+    """Format a datetime as ISO 8601, assuming UTC for naive values"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def emit_source(json_schema: Mapping[str, Any]) -> Optional[str]:
+    """
+    Generate the source of a converter for validated data of a JSON Schema.
+
+    The generated function is named ``convert``, takes the output of
+    ``model_dump()`` and converts datetime values to timezone-aware ISO
+    strings in place.
+
+    Args:
+        json_schema: JSON Schema produced by the string parser
+
+    Returns:
+        Python source code, or None if the schema has no datetime fields
+
+    Example:
+        print(emit_source(parse_string_schema("created:datetime, name:string")))
+        # def convert(data):
+        #     v1 = data.get('created')
+        #     if isinstance(v1, datetime):
+        #         data['created'] = _iso_utc(v1)
+        #     return data
+    """
+    lines: List[str] = []
+    counter = [0]
+
+    if json_schema.get('type') == 'array':
+        items_schema = json_schema.get('items', {})
+        if items_schema.get('type') != 'object':
+            return None
+        lines.append("    for item in data:")
+        lines.append("        if isinstance(item, dict):")
+        body_start = len(lines)
+        _emit_object(items_schema, "item", 3, lines, counter)
+        if len(lines) == body_start:
+            return None
+    else:
+        _emit_object(json_schema, "data", 1, lines, counter)
+        if not lines:
+            return None
+
+    return "def convert(data):\n" + "\n".join(lines) + "\n    return data\n"
+
+
+def _emit_object(schema: Mapping[str, Any], target: str, depth: int,
+                 lines: List[str], counter: List[int]) -> None:
+    """Append conversion statements for the datetime fields of an object schema"""
+    indent = "    " * depth
+
+    for field_name, field_schema in schema.get('properties', {}).items():
+        counter[0] += 1
+        var = f"v{counter[0]}"
+        key = repr(field_name)
+        start = len(lines)
+        lines.append(f"{indent}{var} = {target}.get({key})")
+
+        if field_schema.get('format') == 'date-time':
+            lines.append(f"{indent}if isinstance({var}, datetime):")
+            lines.append(f"{indent}    {target}[{key}] = _iso_utc({var})")
+        elif field_schema.get('type') == 'object':
+            lines.append(f"{indent}if isinstance({var}, dict):")
+            nested_start = len(lines)
+            _emit_object(field_schema, var, depth + 1, lines, counter)
+            if len(lines) == nested_start:
+                del lines[start:]
+        elif field_schema.get('type') == 'array' and field_schema.get('items', {}).get('type') == 'object':
+            item_var = f"{var}_item"
+            lines.append(f"{indent}if isinstance({var}, list):")
+            lines.append(f"{indent}    for {item_var} in {var}:")
+            lines.append(f"{indent}        if isinstance({item_var}, dict):")
+            nested_start = len(lines)
+            _emit_object(field_schema['items'], item_var, depth + 3, lines, counter)
+            if len(lines) == nested_start:
+                del lines[start:]
+        else:
+            del lines[start:]
+
+
+def compile_converter(json_schema: Mapping[str, Any], name: str = "schema") -> Optional[Callable[[Any], Any]]:
+    """
+    Compile a converter for validated data of a JSON Schema.
+
+    Args:
+        json_schema: JSON Schema produced by the string parser
+        name: Label used in the generated code's filename for tracebacks
+
+    Returns:
+        Converter function, or None if no conversion is needed
+    """
+    source = emit_source(json_schema)
+    if source is None:
+        return None
+
+    namespace = {"datetime": datetime, "_iso_utc": _iso_utc}
+    code = compile(source, f"<string_schema:{name}>", "exec")
+    exec(code, namespace)
+    return namespace["convert"]
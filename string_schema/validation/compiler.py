@@ -0,0 +1,162 @@
+"""
+Validator compilation for String Schema
+
+Compiles a string schema once into a validator function that can be called
+many times. Parsing, syntax checking and Pydantic model generation happen
+when the validator is compiled; each call only validates and converts data.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Type, Union
+from uuid import UUID
+import logging
+
+from ..parsing.string_parser import _get_cached_schema
+from ..utilities import string_to_model
+from ..integrations.msgspec import HAS_MSGSPEC, msgspec, json_schema_to_type
+from .codegen import compile_converter
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def compile_model(schema_str: str) -> Type[Any]:
+    """
+    Create the Pydantic model used to validate data against a string schema.
+
+    Models are cached per schema string, so repeated validation against the
+    same schema reuses one model class instead of generating a new one.
+
+    Args:
+        schema_str: String schema definition
+
+    Returns:
+        Pydantic model class named TempValidationModel
+    """
+    return string_to_model(schema_str, "TempValidationModel")
+
+
+@lru_cache(maxsize=256)
+def compile_validator(schema_str: str) -> Callable[[Any], Union[Dict[str, Any], List[Any]]]:
+    """
+    Compile a string schema into a reusable dict validator.
+
+    Args:
+        schema_str: String schema definition
+
+    Returns:
+        Function taking data (dict, list, model instance, or any object) and
+        returning the validated dict or list, as validate_to_dict() does
+
+    Raises:
+        ValueError: If the schema is invalid
+
+    Example:
+        validate_user = compile_validator("name:string, active:bool=true")
+        validate_user({"name": "John"})  # {'name': 'John', 'active': True}
+    """
+    model = compile_model(schema_str)
+    json_schema = _get_cached_schema(schema_str)
+    is_array_schema = json_schema.get('type') == 'array'
+
+    # Timezone-aware datetime conversion specialized to this schema's datetime
+    # fields; None when the schema has none, so results are returned as dumped.
+    # The schema hash labels the generated code in tracebacks.
+    convert = compile_converter(json_schema, name=str(hash(schema_str)))
+
+    if is_array_schema:
+        def validate_array(data: Any) -> Union[Dict[str, Any], List[Any]]:
+            # For array schemas, validate the data directly
+            try:
+                # Try Pydantic v2 RootModel style
+                validated_instance = model(data)
+                result_data = validated_instance.model_dump() if hasattr(validated_instance, 'model_dump') else validated_instance.dict()
+            except:
+                # Fallback to Pydantic v1 style
+                validated_instance = model(__root__=data)
+                result_data = validated_instance.model_dump()['__root__'] if hasattr(validated_instance, 'model_dump') else validated_instance.dict()['__root__']
+
+            # Process array items for timezone-aware datetime conversion
+            if convert is not None and isinstance(result_data, list):
+                return convert(result_data)
+            return result_data
+
+        return validate_array
+
+    def validate_object(data: Any) -> Dict[str, Any]:
+        # Handle different input types for object schemas
+        if isinstance(data, dict):
+            validated_instance = model(**data)
+        elif hasattr(data, '__dict__'):
+            # Handle objects with attributes
+            validated_instance = model(**data.__dict__)
+        else:
+            # Try direct validation
+            validated_instance = model(data)
+
+        # Return as dictionary with timezone-aware datetime handling
+        if hasattr(validated_instance, 'model_dump'):
+            result_dict = validated_instance.model_dump()
+        else:
+            result_dict = validated_instance.dict()
+
+        # Ensure timezone-aware datetime conversion for consistent API responses
+        if convert is not None:
+            return convert(result_dict)
+        return result_dict
+
+    return validate_object
+
+
+@lru_cache(maxsize=256)
+def compile_native_validator(schema_str: str) -> Callable[[Any], Union[Dict[str, Any], List[Any]]]:
+    """
+    Compile a string schema into a dict validator backed by msgspec.
+
+    The schema is translated once into msgspec Struct types, and data is
+    validated by msgspec's C implementation. When msgspec is not installed,
+    or the schema uses a type msgspec cannot express, this returns the
+    Pydantic-backed validator from compile_validator().
+
+    Results match compile_validator() except that:
+        - invalid data raises msgspec.ValidationError
+        - emails are checked against a pattern rather than by EmailStr
+        - URLs are returned as plain strings rather than HttpUrl
+        - field names with a leading underscore (e.g. "_x:int") are validated,
+          whereas compile_validator() raises ValueError for them
+
+    Args:
+        schema_str: String schema definition
+
+    Returns:
+        Function taking data (dict, list, or any object with attributes) and
+        returning the validated dict or list
+
+    Example:
+        validate_event = compile_native_validator("id:uuid, at:datetime, count:int=0")
+        validate_event(raw_event)
+    """
+    if not HAS_MSGSPEC:
+        return compile_validator(schema_str)
+
+    json_schema = _get_cached_schema(schema_str)
+    try:
+        target_type = json_schema_to_type(json_schema, "TempValidationStruct")
+        # Resolves the whole type tree, surfacing unsupported types now rather than per call
+        msgspec.inspect.type_info(target_type)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Schema not supported by msgspec, using Pydantic validator: {e}")
+        return compile_validator(schema_str)
+
+    convert = compile_converter(json_schema, name=str(hash(schema_str)))
+
+    def validate(data: Any) -> Union[Dict[str, Any], List[Any]]:
+        validated = msgspec.convert(data, target_type, strict=False, from_attributes=True)
+        # Keep datetimes and UUIDs as objects, matching model_dump() output
+        result = msgspec.to_builtins(validated, builtin_types=(datetime, UUID))
+        if convert is not None:
+            return convert(result)
+        return result
+
+    return validate
@@ -12,47 +12,52 @@ from string_schema import parse_string_schema, validate_to_dict
 from string_schema.parsing.string_parser import _parse_default_value, _split_on_equals_outside_parens
 
 
+@pytest.fixture(scope="session")
+def scalar_defaults_schema():
+    """Schema with one default of every scalar kind, parsed once per test session"""
+    return parse_string_schema(
+        'active:bool=true, deleted:bool=false, count:int=0, limit:int=100, '
+        'price:number=9.99, rate:number=0.5, status:string=active, name:string="John"'
+    )
+
+
+@pytest.fixture(scope="session")
+def validation_schema_str():
+    """Schema string shared by the validation tests (exercises the parse/validator caches)"""
+    return "name:string, active:bool=true, count:int=0"
+
+
 class TestHelperFunctions:
     """Test helper functions for parsing defaults"""
-    
-    def test_split_on_equals_outside_parens(self):
+
+    @pytest.mark.parametrize("value, expected", [
+        ("string=hello", ["string", "hello"]),      # Simple case
+        ("int(1,100)=5", ["int(1,100)", "5"]),      # With constraints
+        ("string=a=b", ["string", "a=b"]),          # Multiple equals (only split on first)
+        ("string", ["string"]),                     # No equals
+        ("[{qty:int=1}]", ["[{qty:int=1}]"]),       # Equals inside nested definition
+    ])
+    def test_split_on_equals_outside_parens(self, value, expected):
         """Test splitting on = outside parentheses"""
-        # Simple case
-        assert _split_on_equals_outside_parens("string=hello") == ["string", "hello"]
-        
-        # With constraints
-        assert _split_on_equals_outside_parens("int(1,100)=5") == ["int(1,100)", "5"]
-        
-        # Multiple equals (only split on first)
-        assert _split_on_equals_outside_parens("string=a=b") == ["string", "a=b"]
-        
-        # No equals
-        assert _split_on_equals_outside_parens("string") == ["string"]
-    
-    def test_parse_default_value(self):
-        """Test parsing default values from strings"""
+        assert _split_on_equals_outside_parens(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
         # Booleans
-        assert _parse_default_value("true") == True
-        assert _parse_default_value("false") == False
-        assert _parse_default_value("True") == True
-        assert _parse_default_value("FALSE") == False
-        
+        ("true", True), ("false", False), ("True", True), ("FALSE", False),
         # Null
-        assert _parse_default_value("null") is None
-        assert _parse_default_value("none") is None
-        assert _parse_default_value("None") is None
-        
+        ("null", None), ("none", None), ("None", None),
         # Numbers
-        assert _parse_default_value("123") == 123
-        assert _parse_default_value("45.67") == 45.67
-        assert _parse_default_value("0") == 0
-        
+        ("123", 123), ("45.67", 45.67), ("0", 0),
         # Strings with quotes
-        assert _parse_default_value('"hello"') == "hello"
-        assert _parse_default_value("'world'") == "world"
-        
+        ('"hello"', "hello"), ("'world'", "world"),
         # Strings without quotes
-        assert _parse_default_value("hello") == "hello"
+        ("hello", "hello"),
+    ])
+    def test_parse_default_value(self, value, expected):
+        """Test parsing default values from strings"""
+        result = _parse_default_value(value)
+        assert result == expected
+        assert type(result) is type(expected)
 
 
 class TestBackwardCompatibility:
@@ -131,33 +136,15 @@ class TestBackwardCompatibility:
 class TestDefaultValues:
     """Test new default value syntax"""
     
-    def test_boolean_defaults(self):
-        """Test boolean default values"""
-        schema = parse_string_schema("active:bool=true, deleted:bool=false")
-        
-        assert schema['properties']['active']['default'] == True
-        assert schema['properties']['deleted']['default'] == False
-    
-    def test_integer_defaults(self):
-        """Test integer default values"""
-        schema = parse_string_schema("count:int=0, limit:int=100")
-        
-        assert schema['properties']['count']['default'] == 0
-        assert schema['properties']['limit']['default'] == 100
-    
-    def test_float_defaults(self):
-        """Test float default values"""
-        schema = parse_string_schema("price:number=9.99, rate:number=0.5")
-        
-        assert schema['properties']['price']['default'] == 9.99
-        assert schema['properties']['rate']['default'] == 0.5
-    
-    def test_string_defaults(self):
-        """Test string default values"""
-        schema = parse_string_schema('status:string=active, name:string="John"')
-        
-        assert schema['properties']['status']['default'] == 'active'
-        assert schema['properties']['name']['default'] == 'John'
+    @pytest.mark.parametrize("field, expected", [
+        ("active", True), ("deleted", False),       # Booleans
+        ("count", 0), ("limit", 100),               # Integers
+        ("price", 9.99), ("rate", 0.5),             # Floats
+        ("status", "active"), ("name", "John"),     # Strings (unquoted and quoted)
+    ])
+    def test_scalar_defaults(self, scalar_defaults_schema, field, expected):
+        """Test boolean, integer, float and string default values"""
+        assert scalar_defaults_schema['properties'][field]['default'] == expected
     
     def test_null_defaults(self):
         """Test null default values"""
@@ -216,6 +203,39 @@ class TestDescriptions:
         assert schema['properties']['email']['description'] == 'User email address'
         assert schema['properties']['email']['format'] == 'email'
 
+    def test_descriptions_inside_nested_objects(self):
+        """Test that descriptions of nested fields stay with the nested field"""
+        schema = parse_string_schema("items:[{name:string | Item name, qty:int | Quantity}]")
+
+        item_props = schema['properties']['items']['items']['properties']
+        assert item_props['name']['description'] == 'Item name'
+        assert item_props['qty']['description'] == 'Quantity'
+
+    @pytest.mark.parametrize("schema_str, field, default, description", [
+        ('smiley:string=":(" | Frown face', 'smiley', ':(', 'Frown face'),
+        ('p:string="[a-z" | Regex start', 'p', '[a-z', 'Regex start'),
+        ('emoji:string=":)" | Smiley (default)', 'emoji', ':)', 'Smiley (default)'),
+        ('a:string="]" | Bracket [close]', 'a', ']', 'Bracket [close]'),
+        ('close:string=")" | Closing paren (right side)', 'close', ')', 'Closing paren (right side)'),
+        ('sep:string="(" | Opening delimiter; pair it with )', 'sep', '(', 'Opening delimiter; pair it with )'),
+    ])
+    def test_description_after_unclosed_bracket_in_default(self, schema_str, field, default, description):
+        """Test that an unclosed or stray bracket in a default does not hide the description"""
+        schema = parse_string_schema(schema_str)
+
+        assert schema['properties'][field]['default'] == default
+        assert schema['properties'][field]['description'] == description
+
+    def test_defaults_inside_nested_objects(self):
+        """Test that defaults of nested fields stay with the nested field"""
+        schema = parse_string_schema("items:[{qty:int=1 | Quantity, tag:string?}]?, bio:text(max=500)?")
+
+        item_props = schema['properties']['items']['items']['properties']
+        assert item_props['qty']['default'] == 1
+        assert item_props['qty']['description'] == 'Quantity'
+        assert schema['properties']['bio']['maxLength'] == 500
+        assert 'required' not in schema
+
 
 class TestCombinedSyntax:
     """Test combined defaults and descriptions"""
@@ -287,25 +307,21 @@ class TestCombinedSyntax:
 class TestValidation:
     """Test validation with defaults"""
     
-    def test_validation_uses_defaults(self):
+    def test_validation_uses_defaults(self, validation_schema_str):
         """Test that validation applies default values"""
-        schema_str = "name:string, active:bool=true, count:int=0"
-        
         # Provide only name
         data = {"name": "John"}
-        result = validate_to_dict(data, schema_str)
+        result = validate_to_dict(data, validation_schema_str)
         
         assert result['name'] == 'John'
         assert result['active'] == True
         assert result['count'] == 0
     
-    def test_validation_overrides_defaults(self):
+    def test_validation_overrides_defaults(self, validation_schema_str):
         """Test that provided values override defaults"""
-        schema_str = "name:string, active:bool=true, count:int=0"
-        
         # Provide all values
         data = {"name": "John", "active": False, "count": 5}
-        result = validate_to_dict(data, schema_str)
+        result = validate_to_dict(data, validation_schema_str)
         
         assert result['name'] == 'John'
         assert result['active'] == False
@@ -7,7 +7,8 @@ from string_schema.parsing.string_parser import (
     parse_string_schema,
     validate_string_schema,
     _normalize_type_name,
-    _parse_enum_values
+    _parse_enum_values,
+    _get_cached_schema
 )
 
 
@@ -108,6 +109,28 @@ class TestStringParsing:
         # Note: Full nested object support would require more complex implementation
 
 
+    def test_repeated_parse_returns_independent_copies(self):
+        """Test that cached parse results are not shared with callers"""
+        schema_str = "name:string, age:int=18"
+        first = parse_string_schema(schema_str)
+        first['properties']['age']['default'] = 99
+        first['required'].append('extra')
+
+        second = parse_string_schema("  " + schema_str + "\n")
+        assert second is not first
+        assert second['properties']['age']['default'] == 18
+        assert second['required'] == ['name', 'age']
+
+    def test_cached_schema_view_is_read_only(self):
+        """Test that the shared cached schema cannot be mutated"""
+        view = _get_cached_schema("tags:[string], status:enum(a,b)=a")
+
+        with pytest.raises(TypeError):
+            view['properties']['status']['default'] = 'b'
+        assert view['properties']['status']['enum'] == ('a', 'b')
+        assert parse_string_schema("tags:[string], status:enum(a,b)=a")['properties']['status']['enum'] == ['a', 'b']
+
+
 class TestStringValidation:
     """Test string schema validation"""
     
@@ -0,0 +1,169 @@
+"""
+Tests for compiled validators
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+try:
+    from pydantic import ValidationError
+    HAS_PYDANTIC = True
+except ImportError:
+    HAS_PYDANTIC = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+from string_schema import parse_string_schema, validate_to_dict, validate_to_model
+from string_schema.validation import compile_model, compile_validator, compile_native_validator
+from string_schema.validation import compiler
+from string_schema.validation.codegen import emit_source, compile_converter
+
+
+@pytest.mark.skipif(not HAS_PYDANTIC, reason="Pydantic not available")
+class TestCompileValidator:
+    """Test compiling string schemas into reusable validators"""
+
+    def test_validator_is_reused(self):
+        """Test that the same schema string compiles to the same validator"""
+        schema_str = "name:string, active:bool=true, count:int=0"
+
+        assert compile_validator(schema_str) is compile_validator(schema_str)
+        assert compile_model(schema_str) is compile_model(schema_str)
+
+    def test_object_validator_applies_defaults(self):
+        """Test that compiled object validators fill in defaults"""
+        validate = compile_validator("name:string, active:bool=true, count:int=0")
+
+        assert validate({"name": "John"}) == {"name": "John", "active": True, "count": 0}
+        assert validate({"name": "Jane", "count": 3}) == {"name": "Jane", "active": True, "count": 3}
+
+    def test_array_validator(self):
+        """Test compiled validators for array schemas"""
+        validate = compile_validator("[{id:int, tag:string=misc}]")
+
+        result = validate([{"id": 1}, {"id": "2", "tag": "x"}])
+        assert result == [{"id": 1, "tag": "misc"}, {"id": 2, "tag": "x"}]
+
+    def test_validator_rejects_invalid_data(self):
+        """Test that compiled validators raise ValidationError"""
+        validate = compile_validator("name:string, age:int(0,120)")
+
+        with pytest.raises(ValidationError):
+            validate({"name": "John", "age": 200})
+
+    def test_matches_validate_to_dict(self):
+        """Test that validate_to_dict and validate_to_model use the compiled model"""
+        schema_str = "name:string, email:email?, age:int=18"
+        data = {"name": "John"}
+
+        assert validate_to_dict(data, schema_str) == compile_validator(schema_str)(data)
+        assert isinstance(validate_to_model(data, schema_str), compile_model(schema_str))
+
+
+@pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec not available")
+class TestCompileNativeValidator:
+    """Test the msgspec-backed validator"""
+
+    def test_matches_pydantic_validator(self):
+        """Test that msgspec and Pydantic validators agree outside the documented differences"""
+        schema_str = "name:string, age:int(0,120)=18, tags:[string](max=3), status:enum(a,b)=a, at:datetime?, v:string|int"
+        data = {"name": "John", "tags": ["x"], "at": datetime(2025, 1, 1), "v": 5}
+
+        result = compile_native_validator(schema_str)(data)
+
+        assert result == {"name": "John", "age": 18, "tags": ["x"], "status": "a",
+                          "at": "2025-01-01T00:00:00+00:00", "v": 5}
+        if HAS_PYDANTIC:
+            assert result == compile_validator(schema_str)(data)
+
+    def test_null_in_union_rejected(self):
+        """Test that None is rejected for string|null, as by the Pydantic validator"""
+        with pytest.raises(msgspec.ValidationError):
+            compile_native_validator("v:string|null")({"v": None})
+        if HAS_PYDANTIC:
+            with pytest.raises(ValidationError):
+                compile_validator("v:string|null")({"v": None})
+
+    def test_email_checked_by_pattern(self):
+        """Test that emails are matched by pattern, which is looser than EmailStr"""
+        validate = compile_native_validator("e:email")
+
+        assert validate({"e": "a..b@example.com"}) == {"e": "a..b@example.com"}
+        with pytest.raises(msgspec.ValidationError):
+            validate({"e": "user@localhost"})
+
+    def test_url_returned_as_string(self):
+        """Test that URLs stay plain strings (compile_validator returns HttpUrl)"""
+        result = compile_native_validator("u:url")({"u": "https://example.com"})
+
+        assert result == {"u": "https://example.com"}
+        assert type(result["u"]) is str
+
+    def test_leading_underscore_field_names(self):
+        """Test that underscore-prefixed fields validate (compile_validator raises ValueError)"""
+        assert compile_native_validator("_x:int")({"_x": "1"}) == {"_x": 1}
+        if HAS_PYDANTIC:
+            with pytest.raises(ValueError):
+                compile_validator("_x:int")
+
+    def test_coerces_and_validates_nested(self):
+        """Test lax coercion inside nested objects and arrays"""
+        validate = compile_native_validator("[{id:int, owner:{name:string, email:email}}](max=2)")
+
+        assert validate([{"id": "1", "owner": {"name": "A", "email": "a@b.co"}}]) == [
+            {"id": 1, "owner": {"name": "A", "email": "a@b.co"}}
+        ]
+
+    def test_invalid_data_raises(self):
+        """Test that constraint violations raise msgspec.ValidationError"""
+        validate = compile_native_validator("name:string, age:int(0,120), email:email?")
+
+        with pytest.raises(msgspec.ValidationError):
+            validate({"name": "John", "age": 200})
+        with pytest.raises(msgspec.ValidationError):
+            validate({"name": "John", "age": 20, "email": "not-an-email"})
+        with pytest.raises(msgspec.ValidationError):
+            validate({"age": 20})
+
+    @pytest.mark.skipif(not HAS_PYDANTIC, reason="Pydantic not available")
+    def test_falls_back_without_msgspec(self, monkeypatch):
+        """Test that the Pydantic validator is used when msgspec is unavailable"""
+        schema_str = "name:string, count:int=0"
+        monkeypatch.setattr(compiler, "HAS_MSGSPEC", False)
+
+        assert compiler.compile_native_validator.__wrapped__(schema_str) is compile_validator(schema_str)
+
+
+class TestCodegen:
+    """Test generated datetime converters"""
+
+    def test_no_converter_without_datetime_fields(self):
+        """Test that schemas without datetime fields need no conversion"""
+        assert emit_source(parse_string_schema("name:string, tags:[string], meta:{count:int}")) is None
+        assert compile_converter(parse_string_schema("[{id:int}]")) is None
+
+    def test_converter_handles_nested_datetimes(self):
+        """Test that generated converters reach nested and array datetime fields"""
+        schema = parse_string_schema("created:datetime, user:{seen:datetime?}, events:[{at:datetime, id:int}]")
+        convert = compile_converter(schema)
+
+        aware = datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc)
+        result = convert({
+            "created": datetime(2025, 1, 1, 12, 0),
+            "user": {"seen": None},
+            "events": [{"at": aware, "id": 1}],
+        })
+
+        assert result["created"] == "2025-01-01T12:00:00+00:00"
+        assert result["user"]["seen"] is None
+        assert result["events"][0] == {"at": "2025-01-01T08:00:00+00:00", "id": 1}
+
+    def test_converter_is_labelled_for_tracebacks(self):
+        """Test that the generated code's filename carries the given label"""
+        convert = compile_converter(parse_string_schema("created:datetime"), name="1234")
+
+        assert convert.__code__.co_filename == "<string_schema:1234>"